@@ -1,36 +1,28 @@
 """Build dynamic system prompt based on current session state."""
 
+from collections.abc import Hashable
+
 from travel_agent.models.preferences import PointsStrategy
 from travel_agent.models.session import ConversationSession, SessionPhase
 
+# Rendered prompts keyed by the session state they depend on. The prompt is rebuilt on
+# every agent turn, but that state rarely changes between turns.
+_PROMPT_CACHE: dict[Hashable, str] = {}
+_PROMPT_CACHE_MAX = 128
 
-def _sanitize_prompt_str(s: str, max_len: int = 100) -> str:
-    """Strip control characters and truncate user-supplied text for safe prompt interpolation."""
-    return s.replace("\n", " ").replace("\r", " ")[:max_len]
-
-
-def build_system_prompt(session: ConversationSession) -> str:
-    balances_text = _format_balances(session)
-    phase_instructions = _phase_instructions(session)
+# Static prompt sections, joined with the per-session ones by _render_system_prompt
+_INTRO = "You are an expert travel points advisor helping a user plan an award trip."
 
-    return f"""You are an expert travel points advisor helping a user plan an award trip.
-
-## User's Points Portfolio
-{balances_text}
-
-## Your Role
-{phase_instructions}
-
-## Core Principles
+_CORE_PRINCIPLES = """## Core Principles
 - Always calculate actual points requirements before recommending transfers.
 - Bilt Rewards is the ONLY issuer with a 1:1 transfer to American Airlines AAdvantage — highlight this advantage when AA is relevant.
 - When computing transfer math: source_points_needed = ceil(destination_points * ratio_from / ratio_to).
 - Present CPP (cents per point) comparisons to help the user understand relative value.
 - Be conversational and concise. Do not ask multiple questions at once.
 - When you have enough information to search, call mark_preferences_complete immediately.
-- IMPORTANT: When calling mark_preferences_complete, do NOT include questions or suggestions in the same response. Just confirm what you're doing. The user will have a chance to refine after reviewing the preferences summary.
+- IMPORTANT: When calling mark_preferences_complete, do NOT include questions or suggestions in the same response. Just confirm what you're doing. The user will have a chance to refine after reviewing the preferences summary."""
 
-## Tool Usage Policy
+_TOOL_POLICY = """## Tool Usage Policy
 - resolve_destination: Call when destination is ambiguous or described in plain language.
 - search_flights: Call with exact IATA codes and dates.
 - search_hotels: Call after you have a resolved city code.
@@ -41,6 +33,58 @@ def build_system_prompt(session: ConversationSession) -> str:
 - mark_preferences_complete: Call as soon as you have: destination, origin, dates, travelers, strategy, flight pref, accommodation pref, nonstop pref.
 """
 
+_POINTS_ONLY_GUIDANCE = "Prefer high-CPP options and diverse issuer usage."
+
+_MIXED_OK_GUIDANCE = (
+    "Location match is more important than points optimization. "
+    "The user wants to stay in or near {display_dest}. "
+    "If the destination does not have its own IATA city code, search hotels using "
+    "latitude and longitude coordinates instead of the nearest major city's code. "
+    "For example, for Sedona use latitude=34.87, longitude=-111.76 rather than "
+    "city_code='PHX'. This ensures hotel results are actually near the destination."
+)
+
+_NONSTOP_GUIDANCE = (
+    "The user prefers nonstop flights. Search with nonstop=true first. "
+    "If no results, retry with nonstop=false and note that only connecting flights are available. "
+)
+
+
+def _sanitize_prompt_str(s: str, max_len: int = 100) -> str:
+    """Strip control characters and truncate user-supplied text for safe prompt interpolation."""
+    # Truncate first: the replacements are one-for-one, so this bounds the work by max_len
+    return s[:max_len].replace("\n", " ").replace("\r", " ")
+
+
+def build_system_prompt(session: ConversationSession) -> str:
+    key = _prompt_key(session)
+    prompt = _PROMPT_CACHE.get(key)
+    if prompt is None:
+        if len(_PROMPT_CACHE) >= _PROMPT_CACHE_MAX:
+            del _PROMPT_CACHE[next(iter(_PROMPT_CACHE))]
+        prompt = _PROMPT_CACHE[key] = _render_system_prompt(session)
+    return prompt
+
+
+def _prompt_key(session: ConversationSession) -> Hashable:
+    """Everything the rendered prompt depends on, as a hashable tuple."""
+    return (
+        session.phase,
+        session.profile_loaded,
+        tuple((b.issuer, b.program, b.balance) for b in session.points_balances),
+        tuple(vars(session.preferences).values()),
+    )
+
+
+def _render_system_prompt(session: ConversationSession) -> str:
+    return "\n\n".join([
+        _INTRO,
+        "## User's Points Portfolio\n" + _format_balances(session),
+        "## Your Role\n" + _phase_instructions(session),
+        _CORE_PRINCIPLES,
+        _TOOL_POLICY,
+    ])
+
 
 def _format_balances(session: ConversationSession) -> str:
     if not session.points_balances:
@@ -88,25 +132,11 @@ def _phase_instructions(session: ConversationSession) -> str:
         iata_dest = prefs.resolved_destination
 
         if prefs.points_strategy == PointsStrategy.points_only:
-            strategy_guidance = (
-                "Prefer high-CPP options and diverse issuer usage."
-            )
+            strategy_guidance = _POINTS_ONLY_GUIDANCE
         else:
-            strategy_guidance = (
-                "Location match is more important than points optimization. "
-                f"The user wants to stay in or near {display_dest}. "
-                "If the destination does not have its own IATA city code, search hotels using "
-                "latitude and longitude coordinates instead of the nearest major city's code. "
-                "For example, for Sedona use latitude=34.87, longitude=-111.76 rather than "
-                "city_code='PHX'. This ensures hotel results are actually near the destination."
-            )
+            strategy_guidance = _MIXED_OK_GUIDANCE.format(display_dest=display_dest)
 
-        nonstop_guidance = ""
-        if prefs.nonstop_preferred:
-            nonstop_guidance = (
-                "The user prefers nonstop flights. Search with nonstop=true first. "
-                "If no results, retry with nonstop=false and note that only connecting flights are available. "
-            )
+        nonstop_guidance = _NONSTOP_GUIDANCE if prefs.nonstop_preferred else ""
 
         tier = prefs.accommodation_tier.value
         hotel_fallback_guidance = (
@@ -1,9 +1,11 @@
 """Tool schemas and executor for the travel agent."""
 
-import json
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any
 
+import orjson
+
 from travel_agent.clients.amadeus import AmadeusClient
 from travel_agent.clients.transfer import TransferPartnerDB
 from travel_agent.models.points import CurrencyProgram, Issuer, PointsBalance
@@ -228,6 +230,20 @@ TOOL_SCHEMAS: list[dict[str, Any]] = [
     },
 ]
 
+TOOL_SCHEMAS_BY_NAME: dict[str, dict[str, Any]] = {s["name"]: s for s in TOOL_SCHEMAS}
+
+
+def encode_tool_result(result: Any) -> str:
+    """Serialize a raw tool result into the JSON string sent back to Claude.
+
+    Never raises: values orjson cannot encode (non-str keys, ints beyond 64 bits)
+    become an error payload, as an exception inside a tool would.
+    """
+    try:
+        return orjson.dumps(result, default=str).decode()
+    except TypeError as exc:  # orjson.JSONEncodeError subclasses TypeError
+        return orjson.dumps({"error": str(exc)}).decode()
+
 
 class ToolExecutor:
     def __init__(
@@ -242,20 +258,27 @@ class ToolExecutor:
         # State shared between tool calls within a session
         self._last_flights: list[FlightOption] = []
         self._last_hotels: list[HotelOption] = []
+        # Every schema has a matching _tool_<name> method
+        self._handlers: dict[str, Callable[..., Any]] = {
+            name: getattr(self, f"_tool_{name}") for name in TOOL_SCHEMAS_BY_NAME
+        }
 
     @property
     def balance_map(self) -> dict[Issuer, int]:
         return {b.issuer: b.balance for b in self._balances}
 
     def execute(self, name: str, inputs: dict[str, Any]) -> str:
-        handler = getattr(self, f"_tool_{name}", None)
+        return encode_tool_result(self.execute_raw(name, inputs))
+
+    def execute_raw(self, name: str, inputs: dict[str, Any]) -> Any:
+        """Run a tool and return its result as Python objects, before JSON encoding."""
+        handler = self._handlers.get(name)
         if handler is None:
-            return json.dumps({"error": f"Unknown tool: {name}"})
+            return {"error": f"Unknown tool: {name}"}
         try:
-            result = handler(**inputs)
-            return json.dumps(result, default=str)
+            return handler(**inputs)
         except Exception as exc:
-            return json.dumps({"error": str(exc)})
+            return {"error": str(exc)}
 
     def _tool_resolve_destination(self, query: str) -> list[dict[str, Any]]:
         # Heuristic mapping for common destinations
@@ -367,10 +390,10 @@ class ToolExecutor:
                 )
             )
 
-        plan = TripPlan(
+        plan = TripPlan.model_construct(
             flight=flight,
             hotel=hotel,
-            points_breakdown=breakdown,
+            points_breakdown=tuple(breakdown),
             total_cash_usd=flight.cash_taxes_usd,
             summary_label=summary_label,
         )
@@ -456,8 +479,8 @@ class ToolExecutor:
 def _flight_to_dict(index: int, f: FlightOption) -> dict[str, Any]:
     return {
         "index": index,
-        "outbound": [s.model_dump() for s in f.outbound_segments],
-        "inbound": [s.model_dump() for s in f.inbound_segments],
+        "outbound": [s._asdict() for s in f.outbound_segments],
+        "inbound": [s._asdict() for s in f.inbound_segments],
         "total_miles_required": f.total_miles_required,
         "program_to_book": f.program_to_book.value,
         "source_issuer": f.source_issuer.value,
@@ -483,6 +506,8 @@ def _hotel_to_dict(index: int, h: HotelOption) -> dict[str, Any]:
 
 
 def _trip_plan_to_dict(plan: TripPlan) -> dict[str, Any]:
+    # Built field by field rather than via model_dump: cheaper for these flat
+    # models, and each derived Decimal is read exactly once
     return {
         "flight": _flight_to_dict(0, plan.flight),
         "hotel": _hotel_to_dict(0, plan.hotel),
@@ -274,7 +274,7 @@ def _mock_flight_options(
     options = []
     for program, issuer, code, miles in airline_programs:
         options.append(
-            FlightOption(
+            FlightOption.model_construct(
                 outbound_segments=[
                     FlightSegment(
                         origin=origin,
@@ -307,7 +307,7 @@ def _mock_flight_options(
     if not nonstop:
         # Add a connecting flight via DEN
         options.append(
-            FlightOption(
+            FlightOption.model_construct(
                 outbound_segments=[
                     FlightSegment(
                         origin=origin,
@@ -365,7 +365,7 @@ def _mock_hotel_options(city_code: str, check_in: str, check_out: str) -> list[H
     options = []
     for name, chain, program, issuer, stars, points in hotels:
         options.append(
-            HotelOption(
+            HotelOption.model_construct(
                 hotel_name=name,
                 hotel_chain=chain,
                 star_rating=stars,
@@ -415,7 +415,7 @@ def _mock_hotel_options_geocode(
     options = []
     for name, chain, program, issuer, stars, points in hotels:
         options.append(
-            HotelOption(
+            HotelOption.model_construct(
                 hotel_name=name,
                 hotel_chain=chain,
                 star_rating=stars,
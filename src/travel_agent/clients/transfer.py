@@ -9,6 +9,7 @@ from travel_agent.models.points import (
     CurrencyProgram,
     Issuer,
     ISSUER_TO_PROGRAM,
+    PROGRAM_TO_ISSUER,
     PointValuation,
     TransferPartner,
 )
@@ -54,7 +55,7 @@ class TransferPartnerDB:
         results = []
         for partner in self.partners_for_destination(destination_program):
             # Find which issuer holds this source program
-            issuer = _program_to_issuer(partner.source_program)
+            issuer = PROGRAM_TO_ISSUER.get(partner.source_program)
             if issuer is None:
                 continue
             available = balances.get(issuer, 0)
@@ -80,10 +81,3 @@ class TransferPartnerDB:
     def all_partners_from_issuer(self, issuer: Issuer) -> list[TransferPartner]:
         source_program = ISSUER_TO_PROGRAM[issuer]
         return [p for p in self._partners if p.source_program == source_program]
-
-
-def _program_to_issuer(program: CurrencyProgram) -> Issuer | None:
-    for issuer, prog in ISSUER_TO_PROGRAM.items():
-        if prog == program:
-            return issuer
-    return None
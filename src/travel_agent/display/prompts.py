@@ -18,6 +18,16 @@ from travel_agent.models.travel import TripPlan
 
 console = Console()
 
+FINE_TUNE_OPTIONS: tuple[tuple[str, str], ...] = (
+    ("1", "Swap outbound/inbound flight"),
+    ("2", "Swap hotel"),
+    ("3", "Change cabin class preference"),
+    ("4", "Adjust travel dates"),
+    ("5", "Done — return to plan list"),
+    ("6", "Give feedback in your own words"),
+)
+FINE_TUNE_CHOICES: tuple[str, ...] = tuple(key for key, _ in FINE_TUNE_OPTIONS)
+
 
 def prompt_points_balances() -> list[PointsBalance]:
     """Interactive Rich prompt to collect points balances for all 5 issuers."""
@@ -87,17 +97,12 @@ def prompt_fine_tune_menu(plan: TripPlan) -> str:
     console.print(
         Panel(
             "[bold]Fine-Tune Your Trip[/bold]\n\n"
-            "  [1] Swap outbound/inbound flight\n"
-            "  [2] Swap hotel\n"
-            "  [3] Change cabin class preference\n"
-            "  [4] Adjust travel dates\n"
-            "  [5] Done — return to plan list\n"
-            "  [6] Give feedback in your own words\n",
+            + "".join(f"  [{key}] {label}\n" for key, label in FINE_TUNE_OPTIONS),
             title=f"Fine-Tuning: {plan.summary_label}",
             border_style="yellow",
         )
     )
-    choice = Prompt.ask("Select option", choices=["1", "2", "3", "4", "5", "6"], default="5")
+    choice = Prompt.ask("Select option", choices=list(FINE_TUNE_CHOICES), default="5")
     return choice
 
 
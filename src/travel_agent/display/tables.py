@@ -37,12 +37,19 @@ def render_trip_plans_table(plans: list[TripPlan]) -> None:
         route = f"{seg.origin}→{seg.destination}" if seg else "—"
         dep = seg.departure_time[11:16] if seg and len(seg.departure_time) > 11 else ""
         airline_code = seg.airline if seg else ""
-        flight_str = f"{airline_code} {route}\n{dep} | {flight.program_to_book.value}\n{flight.total_miles_required:,} pts"
-
-        hotel_str = f"{hotel.hotel_name}\n{'★' * int(hotel.star_rating)} {hotel.star_rating}\n{hotel.total_points_required:,} pts"
-
-        total_points = sum(b.points_used for b in plan.points_breakdown)
-        pts_str = f"{total_points:,}"
+        flight_str = "".join([
+            airline_code, " ", route, "\n",
+            dep, " | ", flight.program_to_book.value, "\n",
+            f"{flight.total_miles_required:,}", " pts",
+        ])
+
+        hotel_str = "".join([
+            hotel.hotel_name, "\n",
+            "★" * int(hotel.star_rating), " ", str(hotel.star_rating), "\n",
+            f"{hotel.total_points_required:,}", " pts",
+        ])
+
+        pts_str = f"{plan.total_points:,}"
         cpp_color = "green" if plan.blended_cpp > 1.5 else ("yellow" if plan.blended_cpp > 1.0 else "red")
         cpp_str = f"[{cpp_color}]{plan.blended_cpp:.3f}¢[/{cpp_color}]"
 
@@ -171,11 +178,9 @@ def render_points_breakdown(plan: TripPlan) -> None:
             f"${b.cash_value_usd}",
         )
 
-    total_pts = sum(b.points_used for b in plan.points_breakdown)
-    total_val = sum(b.cash_value_usd for b in plan.points_breakdown)
     table.add_row(
-        "[bold]TOTAL[/bold]", "", f"[bold]{total_pts:,}[/bold]",
-        f"[bold]{plan.blended_cpp:.3f}¢[/bold]", f"[bold]${total_val}[/bold]",
+        "[bold]TOTAL[/bold]", "", f"[bold]{plan.total_points:,}[/bold]",
+        f"[bold]{plan.blended_cpp:.3f}¢[/bold]", f"[bold]${plan.total_value_usd}[/bold]",
     )
 
     console.print(Panel(table, title="[bold]Points Breakdown[/bold]", border_style="yellow"))
@@ -406,8 +406,8 @@ def _handle_fine_tune_swap(
         items: list[dict[str, Any]] = [
             {
                 "index": i,
-                "outbound": [s.model_dump() for s in f.outbound_segments],
-                "inbound": [s.model_dump() for s in f.inbound_segments],
+                "outbound": [s._asdict() for s in f.outbound_segments],
+                "inbound": [s._asdict() for s in f.inbound_segments],
                 "total_miles_required": f.total_miles_required,
                 "program_to_book": f.program_to_book.value,
                 "cash_taxes_usd": str(f.cash_taxes_usd),
@@ -0,0 +1,14 @@
+"""Pydantic configuration shared by the domain models."""
+
+from pydantic import ConfigDict
+
+# Immutable models the code builds from explicit keywords, so anything extra is a bug
+VALUE_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+# Immutable models loaded from the user-editable data files; unknown keys there
+# (notes, future fields) are ignored rather than failing startup
+LOADED_CONFIG = ConfigDict(frozen=True)
+
+# Immutable cost models whose dumps include computed values; ignoring extras lets a
+# dump validate back into the model
+DERIVED_CONFIG = ConfigDict(frozen=True, extra="ignore")
@@ -3,6 +3,8 @@ from enum import Enum
 
 from pydantic import BaseModel, field_validator
 
+from travel_agent.models.base import LOADED_CONFIG, VALUE_CONFIG
+
 
 class Issuer(str, Enum):
     chase = "chase"
@@ -55,8 +57,12 @@ ISSUER_TO_PROGRAM: dict[Issuer, CurrencyProgram] = {
     Issuer.bilt: CurrencyProgram.bilt_rewards,
 }
 
+PROGRAM_TO_ISSUER: dict[CurrencyProgram, Issuer] = {p: i for i, p in ISSUER_TO_PROGRAM.items()}
+
 
 class PointsBalance(BaseModel):
+    model_config = VALUE_CONFIG
+
     issuer: Issuer
     program: CurrencyProgram
     balance: int
@@ -70,6 +76,8 @@ class PointsBalance(BaseModel):
 
 
 class TransferPartner(BaseModel):
+    model_config = LOADED_CONFIG
+
     source_program: CurrencyProgram
     destination_program: CurrencyProgram
     ratio_from: int
@@ -78,10 +86,12 @@ class TransferPartner(BaseModel):
 
     def source_points_needed(self, destination_points: int) -> int:
         """Compute source points required to obtain `destination_points`."""
-        return int((destination_points * self.ratio_from + self.ratio_to - 1) // self.ratio_to)
+        return (destination_points * self.ratio_from + self.ratio_to - 1) // self.ratio_to
 
 
 class PointValuation(BaseModel):
+    model_config = LOADED_CONFIG
+
     program: CurrencyProgram
     cpp: Decimal  # cents per point
     source_date: str
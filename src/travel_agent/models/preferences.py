@@ -2,6 +2,8 @@ from enum import Enum
 
 from pydantic import BaseModel, computed_field
 
+from travel_agent.models.base import VALUE_CONFIG
+
 
 class PointsStrategy(str, Enum):
     points_only = "POINTS_ONLY"
@@ -23,6 +25,8 @@ class AccommodationTier(str, Enum):
 
 
 class TravelPreferences(BaseModel):
+    model_config = VALUE_CONFIG
+
     destination_query: str = ""
     resolved_destination: str = ""   # IATA city/airport code
     destination_display_name: str = ""  # Human-readable place name, e.g. "Sedona, AZ"
@@ -18,6 +18,8 @@ DEFAULT_PROFILE_PATH = Path.home() / ".config" / "travel-agent" / "profile.toml"
 
 logger = logging.getLogger(__name__)
 
+_POINTS_FIELDS = ("chase", "amex", "citi", "capital_one", "bilt")
+
 
 class ProfilePreferences(BaseModel):
     origin_airport: str = ""
@@ -62,42 +64,46 @@ class UserProfile(BaseModel):
 
     @property
     def has_points(self) -> bool:
-        return any(
-            getattr(self.points, f) > 0
-            for f in ("chase", "amex", "citi", "capital_one", "bilt")
-        )
+        return any(getattr(self.points, f) > 0 for f in _POINTS_FIELDS)
 
     @property
     def has_preferences(self) -> bool:
         return bool(self.preferences.origin_airport)
 
 
-def load_profile(path: Path = DEFAULT_PROFILE_PATH) -> UserProfile | None:
-    if not path.exists():
-        return None
+def profile_from_toml(text: str, source: str = "<string>") -> UserProfile | None:
+    """Parse profile TOML; returns None (and logs) if it is malformed or invalid."""
     try:
-        raw = path.read_text(encoding="utf-8")
-        data: dict[str, Any] = tomllib.loads(raw)
+        data: dict[str, Any] = tomllib.loads(text)
         prefs = ProfilePreferences(**data.get("preferences", {}))
         points = ProfilePoints(**data.get("points", {}))
         return UserProfile(preferences=prefs, points=points)
     except (tomllib.TOMLDecodeError, ValidationError, ValueError, KeyError) as exc:
+        logger.warning("Failed to load profile from %s: %s", source, exc)
+        return None
+
+
+def load_profile(path: Path = DEFAULT_PROFILE_PATH) -> UserProfile | None:
+    if not path.exists():
+        return None
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
         logger.warning("Failed to load profile from %s: %s", path, exc)
         return None
+    return profile_from_toml(text, source=str(path))
 
 
 def _toml_escape(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"')
 
 
-def save_profile(profile: UserProfile, path: Path = DEFAULT_PROFILE_PATH) -> Path:
-    path.parent.mkdir(parents=True, exist_ok=True)
-
+def profile_to_toml(profile: UserProfile) -> str:
     p = profile.preferences
     pt = profile.points
     origin = _toml_escape(p.origin_airport)
 
-    content = f"""\
+    return f"""\
 # Travel Points Planner — User Profile
 
 [preferences]
@@ -115,5 +121,9 @@ citi = {pt.citi}
 capital_one = {pt.capital_one}
 bilt = {pt.bilt}
 """
-    path.write_text(content, encoding="utf-8")
+
+
+def save_profile(profile: UserProfile, path: Path = DEFAULT_PROFILE_PATH) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(profile_to_toml(profile), encoding="utf-8")
     return path
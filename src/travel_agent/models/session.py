@@ -1,12 +1,15 @@
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from travel_agent.models.points import PointsBalance
 from travel_agent.models.preferences import TravelPreferences
 from travel_agent.models.travel import TripPlan
 
+# Oldest messages are dropped beyond this so each API call's input stays bounded
+MAX_HISTORY_MESSAGES = 200
+
 
 class SessionPhase(str, Enum):
     POINTS_INPUT = "POINTS_INPUT"
@@ -18,8 +21,18 @@ class SessionPhase(str, Enum):
     FINALIZING = "FINALIZING"
     COMPLETE = "COMPLETE"
 
+    @property
+    def order(self) -> int:
+        """Position of this phase in the planning flow."""
+        return _PHASE_ORDER[self]
+
+
+_PHASE_ORDER: dict[SessionPhase, int] = {p: i for i, p in enumerate(SessionPhase)}
+
 
 class FineTuneState(BaseModel):
+    model_config = ConfigDict(extra="forbid")  # mutated in place as the session advances
+
     active: bool = False
     target_plan_index: int = 0
     pending_alternative_flights: list[Any] = Field(default_factory=list)
@@ -27,6 +40,8 @@ class FineTuneState(BaseModel):
 
 
 class ConversationSession(BaseModel):
+    model_config = ConfigDict(extra="forbid")  # mutated in place as the session advances
+
     phase: SessionPhase = SessionPhase.POINTS_INPUT
     points_balances: list[PointsBalance] = Field(default_factory=list)
     preferences: TravelPreferences = Field(default_factory=TravelPreferences)
@@ -38,6 +53,20 @@ class ConversationSession(BaseModel):
 
     def add_message(self, role: str, content: Any) -> None:
         self.conversation_history.append({"role": role, "content": content})
+        if len(self.conversation_history) > MAX_HISTORY_MESSAGES:
+            self._trim_history()
+
+    def _trim_history(self) -> None:
+        """Drop the oldest messages so the history restarts at a plain user turn.
+
+        Cutting anywhere else could leave a tool_result without its tool_use, which the
+        API rejects. If no such turn exists in the kept window, nothing is dropped.
+        """
+        history = self.conversation_history
+        for start in range(len(history) - MAX_HISTORY_MESSAGES, len(history)):
+            if _is_plain_user_message(history[start]):
+                del history[:start]
+                return
 
     def advance_phase(self, next_phase: SessionPhase) -> None:
         self.phase = next_phase
@@ -59,6 +88,10 @@ class ConversationSession(BaseModel):
         self.conversation_history.append(summary)
 
 
+def _is_plain_user_message(message: dict[str, Any]) -> bool:
+    return message.get("role") == "user" and isinstance(message.get("content"), str)
+
+
 def _is_search_tool_exchange(message: dict[str, Any]) -> bool:
     content = message.get("content", "")
     if isinstance(content, list):
@@ -1,11 +1,47 @@
+from collections.abc import Mapping
 from decimal import Decimal
+from functools import cached_property
+from typing import Any, NamedTuple, Self
 
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, computed_field, field_serializer
 
+from travel_agent.models.base import DERIVED_CONFIG, VALUE_CONFIG
 from travel_agent.models.points import CurrencyProgram, Issuer
 
+_Q_MILLI = Decimal("0.001")
+_ZERO = Decimal("0")
+_HUNDRED = Decimal(100)
 
-class FlightSegment(BaseModel):
+
+# Derived values are computed in exact integers rather than under a reduced-precision
+# Decimal context: the operands are tiny, so localcontext() only adds overhead
+def _div_half_even(n: int, d: int) -> int:
+    """Integer n / d rounded half-to-even, matching Decimal.quantize's default rounding."""
+    if d < 0:
+        n, d = -n, -d
+    q, r = divmod(n, d)
+    if 2 * r > d or (2 * r == d and q & 1):
+        q += 1
+    return q
+
+
+class _DerivedCacheModel(BaseModel):
+    """Base for frozen models that cache values derived from their own fields.
+
+    model_copy() copies the instance __dict__, cached values included, so a copy made
+    with update=... drops them and recomputes on the next read.
+    """
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            fields = type(self).model_fields
+            for name in [k for k in copied.__dict__ if k not in fields]:
+                del copied.__dict__[name]
+        return copied
+
+
+class FlightSegment(NamedTuple):
     origin: str
     destination: str
     departure_time: str
@@ -15,6 +51,8 @@ class FlightSegment(BaseModel):
 
 
 class FlightOption(BaseModel):
+    model_config = VALUE_CONFIG
+
     outbound_segments: list[FlightSegment]
     inbound_segments: list[FlightSegment]
     total_miles_required: int
@@ -24,8 +62,14 @@ class FlightOption(BaseModel):
     cash_taxes_usd: Decimal = Decimal("0")
     amadeus_offer_id: str = ""
 
+    @field_serializer("outbound_segments", "inbound_segments")
+    def _segments_as_dicts(self, segments: list[FlightSegment]) -> list[dict[str, Any]]:
+        return [s._asdict() for s in segments]
+
 
 class HotelOption(BaseModel):
+    model_config = VALUE_CONFIG
+
     hotel_name: str
     hotel_chain: str = ""
     star_rating: float = 3.0
@@ -37,37 +81,69 @@ class HotelOption(BaseModel):
     amadeus_hotel_id: str = ""
 
 
-class PointsCostBreakdown(BaseModel):
+class PointsCostBreakdown(_DerivedCacheModel):
+    model_config = DERIVED_CONFIG
+
     issuer: Issuer
     program: CurrencyProgram
     points_used: int
     cpp: Decimal  # base valuation cents per point
 
+    @cached_property
+    def _derived(self) -> tuple[Decimal, Decimal]:
+        """(cash value in dollars, effective cents per point after rounding to the cent)."""
+        # cpp is cents per point, so cpp * points_used is already in cents
+        num, den = self.cpp.as_integer_ratio()
+        cents = _div_half_even(num * self.points_used, den)
+        effective = (
+            Decimal(_div_half_even(cents * 1000, self.points_used)).scaleb(-3)
+            if self.points_used
+            else _ZERO
+        )
+        return Decimal(cents).scaleb(-2), effective
+
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def cash_value_usd(self) -> Decimal:
-        return (self.cpp * self.points_used / 100).quantize(Decimal("0.01"))
+        return self._derived[0]
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def effective_cpp(self) -> Decimal:
-        if self.points_used == 0:
-            return Decimal("0")
-        return (self.cash_value_usd * 100 / self.points_used).quantize(Decimal("0.001"))
+        return self._derived[1]
 
 
-class TripPlan(BaseModel):
+class TripPlan(_DerivedCacheModel):
+    model_config = DERIVED_CONFIG
+
     flight: FlightOption
     hotel: HotelOption
-    points_breakdown: list[PointsCostBreakdown]
+    points_breakdown: tuple[PointsCostBreakdown, ...]  # immutable so the cached totals stay valid
     total_cash_usd: Decimal = Decimal("0")
     summary_label: str = ""
 
-    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def _totals(self) -> tuple[int, Decimal]:
+        """(total points used, total cash value) across the breakdown."""
+        total_points = 0
+        total_value = _ZERO
+        for b in self.points_breakdown:
+            total_points += b.points_used
+            total_value += b.cash_value_usd
+        return total_points, total_value
+
+    @property
+    def total_points(self) -> int:
+        return self._totals[0]
+
     @property
+    def total_value_usd(self) -> Decimal:
+        return self._totals[1]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
     def blended_cpp(self) -> Decimal:
-        total_points = sum(b.points_used for b in self.points_breakdown)
-        total_value = sum(b.cash_value_usd for b in self.points_breakdown)
+        total_points, total_value = self._totals
         if total_points == 0:
-            return Decimal("0")
-        return (Decimal(total_value) * 100 / total_points).quantize(Decimal("0.001"))
+            return _ZERO
+        return (total_value * _HUNDRED / total_points).quantize(_Q_MILLI)
@@ -1,23 +1,77 @@
 """Shared fixtures for travel-agent tests."""
 
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+
 import pytest
 
+from travel_agent.agent.tools import ToolExecutor
 from travel_agent.clients.amadeus import AmadeusClient
 from travel_agent.clients.transfer import TransferPartnerDB
-from travel_agent.models.points import Issuer, PointsBalance, ISSUER_TO_PROGRAM
+from travel_agent.models.points import (
+    CurrencyProgram,
+    Issuer,
+    PointsBalance,
+    TransferPartner,
+    ISSUER_TO_PROGRAM,
+)
+from travel_agent.models.preferences import (
+    AccommodationTier,
+    FlightTimePreference,
+    PointsStrategy,
+    TravelPreferences,
+)
 
 
-@pytest.fixture
-def mock_amadeus() -> AmadeusClient:
-    return AmadeusClient(mock=True)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Under `pytest -n auto --dist=loadgroup` the in-memory tests share one worker,
+    # so the session fixtures below are built once rather than once per worker.
+    # That is nearly every test, so such a run is close to serial by design.
+    for item in items:
+        if item.get_closest_marker("io") is None:
+            item.add_marker(pytest.mark.no_io)
+            item.add_marker(pytest.mark.xdist_group("no_io"))
+        else:
+            item.add_marker(pytest.mark.xdist_group("io"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_amadeus() -> Iterator[AmadeusClient]:
+    client = AmadeusClient(mock=True)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
 def transfer_db() -> TransferPartnerDB:
     return TransferPartnerDB()
 
 
-@pytest.fixture
+PartnersFor = Callable[[CurrencyProgram], tuple[TransferPartner, ...]]
+PartnerIndex = dict[CurrencyProgram, dict[CurrencyProgram, TransferPartner]]
+
+
+@pytest.fixture(scope="session")
+def partners_for(transfer_db: TransferPartnerDB) -> PartnersFor:
+    """partners_for_destination, memoized per destination for the whole run."""
+
+    @lru_cache(maxsize=None)
+    def _lookup(dest: CurrencyProgram) -> tuple[TransferPartner, ...]:
+        return tuple(transfer_db.partners_for_destination(dest))
+
+    return _lookup
+
+
+@pytest.fixture(scope="session")
+def partners_by_dest_source(transfer_db: TransferPartnerDB) -> PartnerIndex:
+    """partners[destination][source]; each pair has at most one partner entry."""
+    idx: PartnerIndex = {}
+    for p in transfer_db._partners:
+        idx.setdefault(p.destination_program, {})[p.source_program] = p
+    return idx
+
+
+@pytest.fixture(scope="session")
 def sample_balances() -> list[PointsBalance]:
     return [
         PointsBalance(issuer=Issuer.chase, program=ISSUER_TO_PROGRAM[Issuer.chase], balance=100_000),
@@ -26,3 +80,38 @@ def sample_balances() -> list[PointsBalance]:
         PointsBalance(issuer=Issuer.capital_one, program=ISSUER_TO_PROGRAM[Issuer.capital_one], balance=60_000),
         PointsBalance(issuer=Issuer.bilt, program=ISSUER_TO_PROGRAM[Issuer.bilt], balance=30_000),
     ]
+
+
+@pytest.fixture(scope="session")
+def sample_full_prefs() -> TravelPreferences:
+    """Stable profile-style defaults; TravelPreferences is frozen, so sharing it is safe."""
+    return TravelPreferences(
+        origin_airport="SFO",
+        num_travelers=2,
+        flight_time_preference=FlightTimePreference.morning,
+        accommodation_tier=AccommodationTier.upscale,
+        points_strategy=PointsStrategy.mixed_ok,
+    )
+
+
+@pytest.fixture
+def executor(mock_amadeus: AmadeusClient, transfer_db: TransferPartnerDB, sample_balances: list[PointsBalance]) -> ToolExecutor:
+    # Fresh per test: the executor remembers the last flight/hotel search
+    return ToolExecutor(amadeus=mock_amadeus, transfer_db=transfer_db, balances=list(sample_balances))
+
+
+@pytest.fixture
+def populated_executor(executor: ToolExecutor) -> ToolExecutor:
+    """An executor that has already run a flight and hotel search, so plans can be costed."""
+    executor.execute("search_flights", {
+        "origin": "JFK",
+        "destination": "HNL",
+        "departure_date": "2025-04-15",
+        "return_date": "2025-04-22",
+    })
+    executor.execute("search_hotels", {
+        "city_code": "HNL",
+        "check_in": "2025-04-15",
+        "check_out": "2025-04-22",
+    })
+    return executor
@@ -1,14 +1,22 @@
 """Tests for improvements: location bias fix, free-text feedback, confirmation step, geocode search."""
 
-import inspect
-import json
+from typing import Any
 
 import pytest
 
+import travel_agent.main as main_mod
+from travel_agent.agent.loop import _handle_phase_transition
 from travel_agent.agent.prompts import _sanitize_prompt_str, build_system_prompt
-from travel_agent.agent.tools import TOOL_SCHEMAS, ToolExecutor
-from travel_agent.clients.amadeus import AmadeusClient, _geocode_label
-from travel_agent.clients.transfer import TransferPartnerDB
+from travel_agent.agent.tools import TOOL_SCHEMAS, TOOL_SCHEMAS_BY_NAME, ToolExecutor
+from travel_agent.clients.amadeus import _geocode_label
+from travel_agent.display.prompts import (
+    FINE_TUNE_CHOICES,
+    FINE_TUNE_OPTIONS,
+    prompt_agent_suggestions,
+    prompt_confirm_preferences,
+    prompt_post_search,
+)
+from travel_agent.main import _last_assistant_has_questions
 from travel_agent.models.points import ISSUER_TO_PROGRAM, Issuer, PointsBalance
 from travel_agent.models.preferences import (
     AccommodationTier,
@@ -23,90 +31,85 @@ from travel_agent.models.session import ConversationSession, SessionPhase
 
 @pytest.fixture
 def session(sample_balances: list[PointsBalance]) -> ConversationSession:
-    return ConversationSession(points_balances=sample_balances)
+    return ConversationSession(points_balances=list(sample_balances))
 
 
 @pytest.fixture
-def executor(mock_amadeus: AmadeusClient, transfer_db: TransferPartnerDB, sample_balances: list[PointsBalance]) -> ToolExecutor:
-    return ToolExecutor(amadeus=mock_amadeus, transfer_db=transfer_db, balances=sample_balances)
+def blank_session() -> ConversationSession:
+    return ConversationSession()
 
 
-# ─── Change 1: SEARCHING prompt differs based on points_strategy ─────────────
+@pytest.fixture
+def base_prefs_kwargs() -> dict[str, Any]:
+    return dict(
+        destination_query="Sedona",
+        resolved_destination="PHX",
+        destination_display_name="Sedona, AZ",
+        origin_airport="JFK",
+        departure_date="2025-06-01",
+        return_date="2025-06-08",
+    )
 
-class TestSearchingPromptStrategy:
-    def test_points_only_mentions_high_cpp(self, session: ConversationSession) -> None:
-        session.advance_phase(SessionPhase.SEARCHING)
-        session.preferences = TravelPreferences(
-            destination_query="Sedona",
-            resolved_destination="PHX",
-            destination_display_name="Sedona, AZ",
-            origin_airport="JFK",
-            departure_date="2025-06-01",
-            return_date="2025-06-08",
-            points_strategy=PointsStrategy.points_only,
-        )
-        prompt = build_system_prompt(session)
-        assert "Prefer high-CPP" in prompt
-        assert "Location match is more important" not in prompt
 
-    def test_mixed_ok_prioritizes_location(self, session: ConversationSession) -> None:
-        session.advance_phase(SessionPhase.SEARCHING)
-        session.preferences = TravelPreferences(
-            destination_query="Sedona",
-            resolved_destination="PHX",
-            destination_display_name="Sedona, AZ",
-            origin_airport="JFK",
-            departure_date="2025-06-01",
-            return_date="2025-06-08",
-            points_strategy=PointsStrategy.mixed_ok,
-        )
-        prompt = build_system_prompt(session)
-        assert "Location match is more important" in prompt
-        assert "Sedona, AZ" in prompt
-        assert "latitude" in prompt
-        assert "longitude" in prompt
-        assert "Prefer high-CPP" not in prompt
+# ─── Change 1: SEARCHING prompt differs based on points_strategy ─────────────
 
-    def test_destination_display_name_shown_in_prompt(self, session: ConversationSession) -> None:
+class TestSearchingPromptStrategy:
+    @pytest.mark.parametrize(
+        "strategy, must_contain, must_not_contain",
+        [
+            (PointsStrategy.points_only, ["Prefer high-CPP"], ["Location match is more important"]),
+            (
+                PointsStrategy.mixed_ok,
+                ["Location match is more important", "Sedona, AZ", "latitude", "longitude"],
+                ["Prefer high-CPP"],
+            ),
+            (None, ["Sedona, AZ", "IATA: PHX"], []),
+        ],
+    )
+    def test_prompt_for_strategy(
+        self,
+        session: ConversationSession,
+        base_prefs_kwargs: dict[str, Any],
+        strategy: PointsStrategy | None,
+        must_contain: list[str],
+        must_not_contain: list[str],
+    ) -> None:
         session.advance_phase(SessionPhase.SEARCHING)
-        session.preferences = TravelPreferences(
-            destination_query="Sedona trip",
-            resolved_destination="PHX",
-            destination_display_name="Sedona, AZ",
-            origin_airport="SFO",
-            departure_date="2025-07-01",
-            return_date="2025-07-05",
-        )
+        if strategy is not None:
+            base_prefs_kwargs["points_strategy"] = strategy
+        session.preferences = TravelPreferences(**base_prefs_kwargs)
         prompt = build_system_prompt(session)
-        assert "Sedona, AZ" in prompt
-        assert "IATA: PHX" in prompt
+        for text in must_contain:
+            assert text in prompt
+        for text in must_not_contain:
+            assert text not in prompt
 
 
 # ─── Change 1: search_hotels accepts location_query ─────────────────────────
 
 class TestSearchHotelsLocationQuery:
     def test_schema_has_location_query(self) -> None:
-        hotel_schema = next(s for s in TOOL_SCHEMAS if s["name"] == "search_hotels")
+        hotel_schema = TOOL_SCHEMAS_BY_NAME["search_hotels"]
         props = hotel_schema["input_schema"]["properties"]
         assert "location_query" in props
 
     def test_location_query_surfaces_in_results(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_hotels", {
+        result = executor.execute_raw("search_hotels", {
             "city_code": "HNL",
             "check_in": "2025-04-15",
             "check_out": "2025-04-22",
             "location_query": "Sedona, AZ",
-        }))
+        })
         assert isinstance(result, list)
         assert len(result) > 0
         assert result[0]["location_query"] == "Sedona, AZ"
 
     def test_no_location_query_omits_field(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_hotels", {
+        result = executor.execute_raw("search_hotels", {
             "city_code": "HNL",
             "check_in": "2025-04-15",
             "check_out": "2025-04-22",
-        }))
+        })
         assert isinstance(result, list)
         assert len(result) > 0
         assert "location_query" not in result[0]
@@ -116,7 +119,7 @@ class TestSearchHotelsLocationQuery:
 
 class TestMarkPreferencesSchema:
     def test_schema_has_destination_display_name(self) -> None:
-        schema = next(s for s in TOOL_SCHEMAS if s["name"] == "mark_preferences_complete")
+        schema = TOOL_SCHEMAS_BY_NAME["mark_preferences_complete"]
         props = schema["input_schema"]["properties"]
         assert "destination_display_name" in props
 
@@ -147,15 +150,33 @@ class TestSanitizePromptStr:
         assert _sanitize_prompt_str("Sedona, AZ") == "Sedona, AZ"
 
 
+class TestSystemPromptCache:
+    def test_same_state_reuses_prompt(
+        self, session: ConversationSession, base_prefs_kwargs: dict[str, Any]
+    ) -> None:
+        session.advance_phase(SessionPhase.SEARCHING)
+        session.preferences = TravelPreferences(**base_prefs_kwargs)
+        assert build_system_prompt(session) is build_system_prompt(session)
+
+    def test_state_change_rebuilds_prompt(
+        self, session: ConversationSession, base_prefs_kwargs: dict[str, Any]
+    ) -> None:
+        session.advance_phase(SessionPhase.SEARCHING)
+        session.preferences = TravelPreferences(**base_prefs_kwargs)
+        assert "Travelers: 1." in build_system_prompt(session)
+        session.preferences = session.preferences.model_copy(update={"num_travelers": 2})
+        assert "Travelers: 2." in build_system_prompt(session)
+        session.points_balances[0] = session.points_balances[0].model_copy(update={"balance": 123_456})
+        assert "123,456" in build_system_prompt(session)
+
+
 # ─── Change 2: fine-tune menu includes option 6 ─────────────────────────────
 
 class TestFineTuneMenuOption6:
     def test_prompt_fine_tune_menu_accepts_choice_6(self) -> None:
-        """Verify the menu source includes '6' as a valid choice in Prompt.ask."""
-        from travel_agent.display.prompts import prompt_fine_tune_menu
-        source = inspect.getsource(prompt_fine_tune_menu)
-        assert '"6"' in source
-        assert "Give feedback in your own words" in source
+        """Verify the menu offers '6' as a valid choice."""
+        assert "6" in FINE_TUNE_CHOICES
+        assert dict(FINE_TUNE_OPTIONS)["6"] == "Give feedback in your own words"
 
 
 # ─── Change 3: CONFIRM_PREFERENCES phase exists and transitions ─────────────
@@ -165,10 +186,15 @@ class TestConfirmPreferencesPhase:
         assert hasattr(SessionPhase, "CONFIRM_PREFERENCES")
         assert SessionPhase.CONFIRM_PREFERENCES.value == "CONFIRM_PREFERENCES"
 
+    def test_phase_between_gathering_and_searching(self) -> None:
+        assert (
+            SessionPhase.PREFERENCE_GATHERING.order
+            < SessionPhase.CONFIRM_PREFERENCES.order
+            < SessionPhase.SEARCHING.order
+        )
+
     def test_mark_preferences_transitions_to_confirm(self, session: ConversationSession) -> None:
         """Verify that _handle_phase_transition sends to CONFIRM_PREFERENCES, not SEARCHING."""
-        from travel_agent.agent.loop import _handle_phase_transition
-
         session.advance_phase(SessionPhase.PREFERENCE_GATHERING)
         tool_input = {
             "destination_query": "Sedona",
@@ -194,8 +220,6 @@ class TestConfirmPreferencesPhase:
         assert session.phase == SessionPhase.PREFERENCE_GATHERING
 
     def test_destination_display_name_captured(self, session: ConversationSession) -> None:
-        from travel_agent.agent.loop import _handle_phase_transition
-
         session.advance_phase(SessionPhase.PREFERENCE_GATHERING)
         tool_input = {
             "destination_query": "Sedona trip",
@@ -209,8 +233,6 @@ class TestConfirmPreferencesPhase:
         assert session.preferences.destination_display_name == "Sedona, AZ"
 
     def test_display_name_falls_back_to_query(self, session: ConversationSession) -> None:
-        from travel_agent.agent.loop import _handle_phase_transition
-
         session.advance_phase(SessionPhase.PREFERENCE_GATHERING)
         tool_input = {
             "destination_query": "Sedona trip",
@@ -227,7 +249,6 @@ class TestConfirmPreferencesPhase:
 
 class TestPromptConfirmPreferences:
     def test_function_exists(self) -> None:
-        from travel_agent.display.prompts import prompt_confirm_preferences
         assert callable(prompt_confirm_preferences)
 
 
@@ -235,68 +256,65 @@ class TestPromptConfirmPreferences:
 
 class TestGeocodeHotelSearch:
     def test_schema_has_latitude_longitude(self) -> None:
-        hotel_schema = next(s for s in TOOL_SCHEMAS if s["name"] == "search_hotels")
+        hotel_schema = TOOL_SCHEMAS_BY_NAME["search_hotels"]
         props = hotel_schema["input_schema"]["properties"]
         assert "latitude" in props
         assert "longitude" in props
 
     def test_city_code_no_longer_required(self) -> None:
-        hotel_schema = next(s for s in TOOL_SCHEMAS if s["name"] == "search_hotels")
+        hotel_schema = TOOL_SCHEMAS_BY_NAME["search_hotels"]
         required = hotel_schema["input_schema"]["required"]
         assert "city_code" not in required
         assert "check_in" in required
         assert "check_out" in required
 
-    def test_geocode_search_returns_location_named_hotels(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_hotels", {
-            "latitude": 34.87,
-            "longitude": -111.76,
+    @pytest.mark.parametrize(
+        "latitude, longitude, name_fragment",
+        [
+            (34.87, -111.76, "Sedona"),
+            (10.0, 20.0, "(10.0, 20.0)"),  # unknown coords fall back to a generic label
+        ],
+    )
+    def test_geocode_search_names_hotels_by_location(
+        self, executor: ToolExecutor, latitude: float, longitude: float, name_fragment: str
+    ) -> None:
+        result = executor.execute_raw("search_hotels", {
+            "latitude": latitude,
+            "longitude": longitude,
             "check_in": "2025-06-01",
             "check_out": "2025-06-08",
-        }))
+        })
         assert isinstance(result, list)
         assert len(result) == 3
         names = [h["hotel_name"] for h in result]
-        assert all("Sedona" in name for name in names)
-
-    def test_geocode_search_unknown_coords_uses_fallback(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_hotels", {
-            "latitude": 10.0,
-            "longitude": 20.0,
-            "check_in": "2025-06-01",
-            "check_out": "2025-06-08",
-        }))
-        assert isinstance(result, list)
-        assert len(result) == 3
-        names = [h["hotel_name"] for h in result]
-        assert all("(10.0, 20.0)" in name for name in names)
+        assert all(name_fragment in name for name in names)
 
     def test_city_code_search_still_works(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_hotels", {
+        result = executor.execute_raw("search_hotels", {
             "city_code": "HNL",
             "check_in": "2025-04-15",
             "check_out": "2025-04-22",
-        }))
+        })
         assert isinstance(result, list)
         assert len(result) > 0
         assert result[0]["hotel_name"] == "Grand Hyatt"
 
     def test_no_city_code_or_coords_returns_error(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_hotels", {
+        result = executor.execute_raw("search_hotels", {
             "check_in": "2025-06-01",
             "check_out": "2025-06-08",
-        }))
+        })
         assert isinstance(result, list)
         assert result[0].get("error")
 
     def test_geocode_with_location_query(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_hotels", {
+        result = executor.execute_raw("search_hotels", {
             "latitude": 34.87,
             "longitude": -111.76,
             "check_in": "2025-06-01",
             "check_out": "2025-06-08",
             "location_query": "Sedona, AZ",
-        }))
+        })
         assert result[0]["location_query"] == "Sedona, AZ"
         assert "Sedona" in result[0]["hotel_name"]
 
@@ -314,16 +332,12 @@ class TestGeocodeLabel:
 
 
 class TestMixedOkPromptMentionsGeocode:
-    def test_prompt_mentions_latitude_longitude(self, session: ConversationSession) -> None:
+    def test_prompt_mentions_latitude_longitude(
+        self, session: ConversationSession, base_prefs_kwargs: dict[str, Any]
+    ) -> None:
         session.advance_phase(SessionPhase.SEARCHING)
         session.preferences = TravelPreferences(
-            destination_query="Sedona",
-            resolved_destination="PHX",
-            destination_display_name="Sedona, AZ",
-            origin_airport="JFK",
-            departure_date="2025-06-01",
-            return_date="2025-06-08",
-            points_strategy=PointsStrategy.mixed_ok,
+            **base_prefs_kwargs, points_strategy=PointsStrategy.mixed_ok
         )
         prompt = build_system_prompt(session)
         assert "latitude=34.87" in prompt
@@ -335,12 +349,10 @@ class TestMixedOkPromptMentionsGeocode:
 
 class TestPromptPostSearch:
     def test_function_exists(self) -> None:
-        from travel_agent.display.prompts import prompt_post_search
         assert callable(prompt_post_search)
 
     def test_function_is_importable_from_main(self) -> None:
         """Verify main.py imports prompt_post_search."""
-        import travel_agent.main as main_mod
         assert hasattr(main_mod, "prompt_post_search")
 
 
@@ -348,35 +360,26 @@ class TestPromptPostSearch:
 
 class TestAgentSuggestionsSafetyNet:
     def test_prompt_agent_suggestions_exists(self) -> None:
-        from travel_agent.display.prompts import prompt_agent_suggestions
         assert callable(prompt_agent_suggestions)
 
-    def test_last_assistant_has_questions_true(self) -> None:
-        from travel_agent.main import _last_assistant_has_questions
-        session = ConversationSession()
-        session.add_message("assistant", [{"type": "text", "text": "Would you like option 1 or 2?"}])
-        assert _last_assistant_has_questions(session) is True
-
-    def test_last_assistant_has_questions_false(self) -> None:
-        from travel_agent.main import _last_assistant_has_questions
-        session = ConversationSession()
-        session.add_message("assistant", [{"type": "text", "text": "Great, confirming your preferences now."}])
-        assert _last_assistant_has_questions(session) is False
-
-    def test_last_assistant_has_questions_no_messages(self) -> None:
-        from travel_agent.main import _last_assistant_has_questions
-        session = ConversationSession()
-        assert _last_assistant_has_questions(session) is False
-
-    def test_last_assistant_has_questions_tool_only(self) -> None:
-        from travel_agent.main import _last_assistant_has_questions
-        session = ConversationSession()
-        session.add_message("assistant", [{"type": "tool_use", "id": "x", "name": "mark_preferences_complete", "input": {}}])
-        assert _last_assistant_has_questions(session) is False
-
-    def test_prompt_no_questions_in_mark_preferences_prompt(self) -> None:
+    def test_last_assistant_has_questions_true(self, blank_session: ConversationSession) -> None:
+        blank_session.add_message("assistant", [{"type": "text", "text": "Would you like option 1 or 2?"}])
+        assert _last_assistant_has_questions(blank_session) is True
+
+    def test_last_assistant_has_questions_false(self, blank_session: ConversationSession) -> None:
+        blank_session.add_message("assistant", [{"type": "text", "text": "Great, confirming your preferences now."}])
+        assert _last_assistant_has_questions(blank_session) is False
+
+    def test_last_assistant_has_questions_no_messages(self, blank_session: ConversationSession) -> None:
+        assert _last_assistant_has_questions(blank_session) is False
+
+    def test_last_assistant_has_questions_tool_only(self, blank_session: ConversationSession) -> None:
+        blank_session.add_message("assistant", [{"type": "tool_use", "id": "x", "name": "mark_preferences_complete", "input": {}}])
+        assert _last_assistant_has_questions(blank_session) is False
+
+    def test_prompt_no_questions_in_mark_preferences_prompt(self, blank_session: ConversationSession) -> None:
         """Verify the system prompt tells Claude not to ask questions with mark_preferences_complete."""
-        prompt = build_system_prompt(ConversationSession())
+        prompt = build_system_prompt(blank_session)
         assert "do not include questions" in prompt.lower()
 
 
@@ -392,30 +395,30 @@ class TestNonstopPreference:
         assert prefs.nonstop_preferred is True
 
     def test_mark_preferences_schema_has_nonstop(self) -> None:
-        schema = next(s for s in TOOL_SCHEMAS if s["name"] == "mark_preferences_complete")
+        schema = TOOL_SCHEMAS_BY_NAME["mark_preferences_complete"]
         props = schema["input_schema"]["properties"]
         assert "nonstop_preferred" in props
 
     def test_search_flights_schema_has_nonstop(self) -> None:
-        schema = next(s for s in TOOL_SCHEMAS if s["name"] == "search_flights")
+        schema = TOOL_SCHEMAS_BY_NAME["search_flights"]
         props = schema["input_schema"]["properties"]
         assert "nonstop" in props
 
     def test_get_alternative_flights_schema_has_nonstop(self) -> None:
-        schema = next(s for s in TOOL_SCHEMAS if s["name"] == "get_alternative_flights")
+        schema = TOOL_SCHEMAS_BY_NAME["get_alternative_flights"]
         props = schema["input_schema"]["properties"]
         assert "nonstop" in props
 
 
 class TestNonstopFlightSearch:
     def test_nonstop_true_returns_only_nonstop(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_flights", {
+        result = executor.execute_raw("search_flights", {
             "origin": "SEA",
             "destination": "PHX",
             "departure_date": "2025-06-01",
             "return_date": "2025-06-08",
             "nonstop": True,
-        }))
+        })
         assert isinstance(result, list)
         assert len(result) == 3  # 3 nonstop options, no connecting
         for flight in result:
@@ -423,13 +426,13 @@ class TestNonstopFlightSearch:
             assert len(flight["inbound"]) == 1, "Nonstop should have single inbound segment"
 
     def test_nonstop_false_includes_connecting(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("search_flights", {
+        result = executor.execute_raw("search_flights", {
             "origin": "SEA",
             "destination": "PHX",
             "departure_date": "2025-06-01",
             "return_date": "2025-06-08",
             "nonstop": False,
-        }))
+        })
         assert isinstance(result, list)
         assert len(result) == 4  # 3 nonstop + 1 connecting
         connecting = [f for f in result if len(f["outbound"]) > 1]
@@ -438,17 +441,30 @@ class TestNonstopFlightSearch:
 
     def test_default_nonstop_false_includes_connecting(self, executor: ToolExecutor) -> None:
         """Default search (no nonstop param) should include connecting flights."""
-        result = json.loads(executor.execute("search_flights", {
+        result = executor.execute_raw("search_flights", {
             "origin": "SEA",
             "destination": "PHX",
             "departure_date": "2025-06-01",
             "return_date": "2025-06-08",
-        }))
+        })
         assert len(result) == 4
 
 
 class TestNonstopSearchingPrompt:
-    def test_nonstop_preferred_shows_guidance(self, session: ConversationSession) -> None:
+    @pytest.mark.parametrize(
+        "nonstop_preferred, must_contain, must_not_contain",
+        [
+            (True, ["nonstop=true", "connecting flights"], []),
+            (False, [], ["nonstop=true"]),
+        ],
+    )
+    def test_nonstop_guidance(
+        self,
+        session: ConversationSession,
+        nonstop_preferred: bool,
+        must_contain: list[str],
+        must_not_contain: list[str],
+    ) -> None:
         session.advance_phase(SessionPhase.SEARCHING)
         session.preferences = TravelPreferences(
             destination_query="Phoenix",
@@ -456,30 +472,17 @@ class TestNonstopSearchingPrompt:
             origin_airport="SEA",
             departure_date="2025-06-01",
             return_date="2025-06-08",
-            nonstop_preferred=True,
+            nonstop_preferred=nonstop_preferred,
         )
-        prompt = build_system_prompt(session)
-        assert "nonstop=true" in prompt
-        assert "connecting flights" in prompt.lower()
-
-    def test_no_nonstop_preferred_no_guidance(self, session: ConversationSession) -> None:
-        session.advance_phase(SessionPhase.SEARCHING)
-        session.preferences = TravelPreferences(
-            destination_query="Phoenix",
-            resolved_destination="PHX",
-            origin_airport="SEA",
-            departure_date="2025-06-01",
-            return_date="2025-06-08",
-            nonstop_preferred=False,
-        )
-        prompt = build_system_prompt(session)
-        assert "nonstop=true" not in prompt
+        prompt = build_system_prompt(session).lower()
+        for text in must_contain:
+            assert text in prompt
+        for text in must_not_contain:
+            assert text not in prompt
 
 
 class TestNonstopPhaseTransition:
     def test_nonstop_captured_in_preferences(self, session: ConversationSession) -> None:
-        from travel_agent.agent.loop import _handle_phase_transition
-
         session.advance_phase(SessionPhase.PREFERENCE_GATHERING)
         tool_input = {
             "destination_query": "Phoenix",
@@ -493,8 +496,6 @@ class TestNonstopPhaseTransition:
         assert session.preferences.nonstop_preferred is True
 
     def test_nonstop_defaults_false_when_omitted(self, session: ConversationSession) -> None:
-        from travel_agent.agent.loop import _handle_phase_transition
-
         session.advance_phase(SessionPhase.PREFERENCE_GATHERING)
         tool_input = {
             "destination_query": "Phoenix",
@@ -515,7 +516,7 @@ class TestWebSearchHotels:
         assert "web_search_hotels" in names
 
     def test_schema_properties(self) -> None:
-        schema = next(s for s in TOOL_SCHEMAS if s["name"] == "web_search_hotels")
+        schema = TOOL_SCHEMAS_BY_NAME["web_search_hotels"]
         props = schema["input_schema"]["properties"]
         assert "destination" in props
         assert "check_in" in props
@@ -523,12 +524,12 @@ class TestWebSearchHotels:
         assert "tier" in props
 
     def test_sedona_luxury_returns_known_hotels(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("web_search_hotels", {
+        result = executor.execute_raw("web_search_hotels", {
             "destination": "Sedona, AZ",
             "check_in": "2025-06-01",
             "check_out": "2025-06-08",
             "tier": "luxury",
-        }))
+        })
         assert result["source"] == "web_search"
         names = [r["name"] for r in result["results"]]
         assert "Enchantment Resort" in names
@@ -536,58 +537,55 @@ class TestWebSearchHotels:
         assert "Ambiente, A Landscape Hotel" in names
 
     def test_napa_luxury_returns_known_hotels(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("web_search_hotels", {
+        result = executor.execute_raw("web_search_hotels", {
             "destination": "Napa Valley, CA",
             "check_in": "2025-06-01",
             "check_out": "2025-06-08",
             "tier": "luxury",
-        }))
+        })
         assert result["source"] == "web_search"
         names = [r["name"] for r in result["results"]]
         assert "Meadowood Napa Valley" in names
 
     def test_unknown_destination_returns_generic(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("web_search_hotels", {
+        result = executor.execute_raw("web_search_hotels", {
             "destination": "Timbuktu",
             "check_in": "2025-06-01",
             "check_out": "2025-06-08",
             "tier": "luxury",
-        }))
+        })
         assert result["source"] == "web_search"
         assert len(result["results"]) >= 1
         assert "Timbuktu" in result["results"][0]["name"]
 
     def test_results_include_dates(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("web_search_hotels", {
+        result = executor.execute_raw("web_search_hotels", {
             "destination": "Sedona, AZ",
             "check_in": "2025-06-01",
             "check_out": "2025-06-08",
             "tier": "luxury",
-        }))
+        })
         for r in result["results"]:
             assert r["check_in"] == "2025-06-01"
             assert r["check_out"] == "2025-06-08"
 
     def test_cash_booking_note(self, executor: ToolExecutor) -> None:
-        result = json.loads(executor.execute("web_search_hotels", {
+        result = executor.execute_raw("web_search_hotels", {
             "destination": "Sedona, AZ",
             "check_in": "2025-06-01",
             "check_out": "2025-06-08",
             "tier": "luxury",
-        }))
+        })
         assert "cash-booking" in result["note"].lower()
 
 
 class TestSearchingPromptHotelFallback:
-    def test_prompt_mentions_web_search_hotels(self, session: ConversationSession) -> None:
+    def test_prompt_mentions_web_search_hotels(
+        self, session: ConversationSession, base_prefs_kwargs: dict[str, Any]
+    ) -> None:
         session.advance_phase(SessionPhase.SEARCHING)
         session.preferences = TravelPreferences(
-            destination_query="Sedona",
-            resolved_destination="PHX",
-            destination_display_name="Sedona, AZ",
-            origin_airport="SEA",
-            departure_date="2025-06-01",
-            return_date="2025-06-08",
+            **{**base_prefs_kwargs, "origin_airport": "SEA"},
             accommodation_tier=AccommodationTier.luxury,
         )
         prompt = build_system_prompt(session)
@@ -5,6 +5,8 @@ from decimal import Decimal
 import pytest
 
 from travel_agent.models.points import (
+    ISSUER_TO_PROGRAM,
+    PROGRAM_TO_ISSUER,
     CurrencyProgram,
     Issuer,
     PointsBalance,
@@ -24,7 +26,7 @@ from travel_agent.models.travel import (
     PointsCostBreakdown,
     TripPlan,
 )
-from travel_agent.models.session import ConversationSession, SessionPhase
+from travel_agent.models.session import MAX_HISTORY_MESSAGES, ConversationSession, SessionPhase
 
 
 class TestPointsBalance:
@@ -40,6 +42,11 @@ class TestPointsBalance:
         with pytest.raises(Exception):
             PointsBalance(issuer=Issuer.amex, program=CurrencyProgram.amex_mr, balance=-1)
 
+    def test_program_to_issuer_inverts_issuer_to_program(self) -> None:
+        for issuer in Issuer:
+            assert PROGRAM_TO_ISSUER[ISSUER_TO_PROGRAM[issuer]] is issuer
+        assert CurrencyProgram.united_mileageplus not in PROGRAM_TO_ISSUER
+
 
 class TestTransferPartner:
     def test_1_to_1_ratio(self) -> None:
@@ -52,6 +59,18 @@ class TestTransferPartner:
         )
         assert tp.source_points_needed(30_000) == 30_000
 
+    def test_unknown_data_file_keys_ignored(self) -> None:
+        # TransferPartnerDB builds partners with TransferPartner(**item) from the JSON file
+        item = {
+            "source_program": "chase_ur",
+            "destination_program": "united_mileageplus",
+            "ratio_from": 1,
+            "ratio_to": 1,
+            "transfer_time_hours": 0,
+            "notes": "promo through May",
+        }
+        assert TransferPartner(**item).ratio_to == 1
+
     def test_1_to_2_ratio(self) -> None:
         tp = TransferPartner(
             source_program=CurrencyProgram.amex_mr,
@@ -101,6 +120,17 @@ class TestTravelPreferences:
         )
         assert prefs.is_fully_specified is False
 
+    def test_fully_specified_follows_model_copy_update(self) -> None:
+        prefs = TravelPreferences(
+            resolved_destination="HNL",
+            origin_airport="JFK",
+            departure_date="2025-04-15",
+            return_date="2025-04-22",
+        )
+        assert prefs.is_fully_specified is True
+        # model_copy skips validators and copies cached state, so this must stay derived per read
+        assert prefs.model_copy(update={"return_date": ""}).is_fully_specified is False
+
 
 class TestPointsCostBreakdown:
     def test_cash_value_calculation(self) -> None:
@@ -122,6 +152,54 @@ class TestPointsCostBreakdown:
         )
         assert b.effective_cpp == Decimal("2.050")
 
+    def test_effective_cpp_uses_rounded_cash_value(self) -> None:
+        b = PointsCostBreakdown(
+            issuer=Issuer.chase,
+            program=CurrencyProgram.chase_ur,
+            points_used=7,
+            cpp=Decimal("1.333"),
+        )
+        # 7 * 1.333 = 9.331¢ rounds to $0.09, and 9¢ / 7 pts = 1.286¢
+        assert b.cash_value_usd == Decimal("0.09")
+        assert b.effective_cpp == Decimal("1.286")
+
+    def test_cpp_with_more_than_three_places(self) -> None:
+        # Valuations come from user-editable JSON, so extra precision must still work
+        b = PointsCostBreakdown(
+            issuer=Issuer.chase,
+            program=CurrencyProgram.chase_ur,
+            points_used=30_000,
+            cpp=Decimal("1.3333"),
+        )
+        # 30000 * 1.3333 = 39999¢
+        assert b.cash_value_usd == Decimal("399.99")
+        assert b.effective_cpp == Decimal("1.333")
+
+    def test_negative_points_round_like_quantize(self) -> None:
+        b = PointsCostBreakdown(
+            issuer=Issuer.chase,
+            program=CurrencyProgram.chase_ur,
+            points_used=-3,
+            cpp=Decimal("1.5"),
+        )
+        # -4.5¢ rounds half-even to -4¢, and -4¢ / -3 pts = 1.333¢
+        assert b.cash_value_usd == Decimal("-0.04")
+        assert b.effective_cpp == Decimal("1.333")
+
+    def test_derived_values_follow_model_copy_update(self) -> None:
+        b = PointsCostBreakdown(
+            issuer=Issuer.chase,
+            program=CurrencyProgram.chase_ur,
+            points_used=1_000,
+            cpp=Decimal("1.5"),
+        )
+        assert b.cash_value_usd == Decimal("15.00")
+        assert b.model_copy(update={"points_used": 2_000}).cash_value_usd == Decimal("30.00")
+        constructed = PointsCostBreakdown.model_construct(
+            issuer=Issuer.chase, program=CurrencyProgram.chase_ur, points_used=1_000, cpp=Decimal("1.5")
+        )
+        assert constructed.cash_value_usd == Decimal("15.00")
+
     def test_zero_points_returns_zero_cpp(self) -> None:
         b = PointsCostBreakdown(
             issuer=Issuer.chase,
@@ -143,10 +221,9 @@ class TestTripPlan:
             flight_number="UA101",
         )
 
-    def test_blended_cpp(self) -> None:
-        seg = self._make_segment()
+    def _make_plan(self, breakdown: list[PointsCostBreakdown]) -> TripPlan:
         flight = FlightOption(
-            outbound_segments=[seg],
+            outbound_segments=[self._make_segment()],
             inbound_segments=[self._make_segment("HNL", "JFK")],
             total_miles_required=30_000,
             program_to_book=CurrencyProgram.united_mileageplus,
@@ -160,7 +237,10 @@ class TestTripPlan:
             program_to_book=CurrencyProgram.world_of_hyatt,
             source_issuer=Issuer.chase,
         )
-        breakdown = [
+        return TripPlan(flight=flight, hotel=hotel, points_breakdown=tuple(breakdown))
+
+    def test_blended_cpp(self) -> None:
+        plan = self._make_plan([
             PointsCostBreakdown(
                 issuer=Issuer.chase,
                 program=CurrencyProgram.united_mileageplus,
@@ -173,13 +253,26 @@ class TestTripPlan:
                 points_used=20_000,
                 cpp=Decimal("2.30"),
             ),
-        ]
-        plan = TripPlan(flight=flight, hotel=hotel, points_breakdown=breakdown)
+        ])
         # Total value = 30000*1.35/100 + 20000*2.30/100 = 405 + 460 = 865
         # Total points = 50000
         # Blended CPP = 865/50000 * 100 = 1.73
         assert plan.blended_cpp == Decimal("1.730")
 
+    def test_model_copy_update_recomputes_totals(self) -> None:
+        cheap = PointsCostBreakdown(
+            issuer=Issuer.chase, program=CurrencyProgram.united_mileageplus, points_used=1_000, cpp=Decimal("1.5")
+        )
+        rich = PointsCostBreakdown(
+            issuer=Issuer.chase, program=CurrencyProgram.united_mileageplus, points_used=1_000, cpp=Decimal("3.0")
+        )
+        plan = self._make_plan([cheap])
+        assert plan.blended_cpp == Decimal("1.500")
+        assert plan.total_value_usd == Decimal("15.00")
+        updated = plan.model_copy(update={"points_breakdown": (rich,)})
+        assert updated.blended_cpp == Decimal("3.000")
+        assert updated.total_value_usd == Decimal("30.00")
+
 
 class TestConversationSession:
     def test_initial_phase(self) -> None:
@@ -192,6 +285,18 @@ class TestConversationSession:
         assert len(session.conversation_history) == 1
         assert session.conversation_history[0]["role"] == "user"
 
+    def test_history_capped_at_plain_user_turn(self) -> None:
+        session = ConversationSession()
+        for i in range(MAX_HISTORY_MESSAGES):
+            session.add_message("user", f"question {i}")
+            session.add_message("assistant", [{"type": "tool_use", "id": str(i), "name": "x", "input": {}}])
+            session.add_message("user", [{"type": "tool_result", "tool_use_id": str(i), "content": "{}"}])
+        history = session.conversation_history
+        assert len(history) <= MAX_HISTORY_MESSAGES
+        assert history[0]["role"] == "user"
+        assert isinstance(history[0]["content"], str)
+        assert history[-1]["content"][0]["tool_use_id"] == str(MAX_HISTORY_MESSAGES - 1)
+
     def test_advance_phase(self) -> None:
         session = ConversationSession()
         session.advance_phase(SessionPhase.PREFERENCE_GATHERING)
@@ -4,6 +4,7 @@ from decimal import Decimal
 
 import pytest
 
+from tests.conftest import PartnerIndex, PartnersFor
 from travel_agent.clients.transfer import TransferPartnerDB
 from travel_agent.models.points import CurrencyProgram, Issuer
 from travel_agent.models.travel import (
@@ -15,64 +16,71 @@ from travel_agent.models.travel import (
 )
 
 
-def _make_segment(
-    origin: str = "JFK",
-    dest: str = "HNL",
-    dep: str = "2025-04-15T08:00:00",
-    arr: str = "2025-04-15T14:00:00",
-    airline: str = "UA",
-    fn: str = "UA101",
-) -> FlightSegment:
-    return FlightSegment(
-        origin=origin,
-        destination=dest,
-        departure_time=dep,
-        arrival_time=arr,
-        airline=airline,
-        flight_number=fn,
-    )
+_SEGMENT_OUT = FlightSegment(
+    origin="JFK",
+    destination="HNL",
+    departure_time="2025-04-15T08:00:00",
+    arrival_time="2025-04-15T14:00:00",
+    airline="UA",
+    flight_number="UA101",
+)
+_SEGMENT_IN = _SEGMENT_OUT._replace(origin="HNL", destination="JFK")
+
+# Validated once at import; the factories below only copy with updates
+_TEMPLATE_FLIGHT = FlightOption(
+    outbound_segments=[_SEGMENT_OUT],
+    inbound_segments=[_SEGMENT_IN],
+    total_miles_required=0,
+    program_to_book=CurrencyProgram.united_mileageplus,
+    source_issuer=Issuer.chase,
+)
+_TEMPLATE_HOTEL = HotelOption(
+    hotel_name="Test Hotel",
+    check_in="2025-04-15",
+    check_out="2025-04-22",
+    total_points_required=0,
+    program_to_book=CurrencyProgram.world_of_hyatt,
+    source_issuer=Issuer.chase,
+)
 
 
 def _make_flight(program: CurrencyProgram, miles: int, issuer: Issuer) -> FlightOption:
-    return FlightOption(
-        outbound_segments=[_make_segment()],
-        inbound_segments=[_make_segment("HNL", "JFK")],
-        total_miles_required=miles,
-        program_to_book=program,
-        source_issuer=issuer,
+    return _TEMPLATE_FLIGHT.model_copy(
+        update={"total_miles_required": miles, "program_to_book": program, "source_issuer": issuer}
     )
 
 
 def _make_hotel(program: CurrencyProgram, points: int, issuer: Issuer) -> HotelOption:
-    return HotelOption(
-        hotel_name="Test Hotel",
-        check_in="2025-04-15",
-        check_out="2025-04-22",
-        total_points_required=points,
-        program_to_book=program,
-        source_issuer=issuer,
+    return _TEMPLATE_HOTEL.model_copy(
+        update={"total_points_required": points, "program_to_book": program, "source_issuer": issuer}
     )
 
 
+@pytest.fixture(scope="session")
+def aa_source_programs(partners_for: PartnersFor) -> set[CurrencyProgram]:
+    partners = partners_for(CurrencyProgram.american_airlines_aadvantage)
+    return {p.source_program for p in partners}
+
+
 class TestCPPCalculations:
-    def test_hyatt_high_cpp(self) -> None:
-        b = PointsCostBreakdown(
-            issuer=Issuer.chase,
-            program=CurrencyProgram.world_of_hyatt,
-            points_used=20_000,
-            cpp=Decimal("2.30"),
-        )
-        assert b.cash_value_usd == Decimal("460.00")
-        assert b.effective_cpp == Decimal("2.300")
-
-    def test_delta_skymiles_lower_cpp(self) -> None:
-        b = PointsCostBreakdown(
-            issuer=Issuer.amex,
-            program=CurrencyProgram.delta_skymiles,
-            points_used=50_000,
-            cpp=Decimal("1.20"),
-        )
-        assert b.cash_value_usd == Decimal("600.00")
+    @pytest.mark.parametrize(
+        "issuer,program,points,cpp,expected_cash",
+        [
+            (Issuer.chase, CurrencyProgram.world_of_hyatt, 20_000, Decimal("2.30"), Decimal("460.00")),
+            (Issuer.amex, CurrencyProgram.delta_skymiles, 50_000, Decimal("1.20"), Decimal("600.00")),
+        ],
+    )
+    def test_cpp_cash_value(
+        self,
+        issuer: Issuer,
+        program: CurrencyProgram,
+        points: int,
+        cpp: Decimal,
+        expected_cash: Decimal,
+    ) -> None:
+        b = PointsCostBreakdown(issuer=issuer, program=program, points_used=points, cpp=cpp)
+        assert b.cash_value_usd == expected_cash
+        assert b.effective_cpp == cpp
 
     def test_blended_cpp_weighted_average(self) -> None:
         flight = _make_flight(CurrencyProgram.united_mileageplus, 30_000, Issuer.chase)
@@ -91,36 +99,48 @@ class TestCPPCalculations:
                 cpp=Decimal("2.30"),
             ),
         ]
-        plan = TripPlan(flight=flight, hotel=hotel, points_breakdown=breakdown)
+        plan = TripPlan(flight=flight, hotel=hotel, points_breakdown=tuple(breakdown))
         # (30000*1.35 + 20000*2.30) / 50000 = (40500 + 46000) / 50000 = 86500/50000 = 1.73
         assert plan.blended_cpp == Decimal("1.730")
 
-    def test_bilt_aa_advantage_unique(self, transfer_db: TransferPartnerDB) -> None:
-        """Verify Bilt is the only issuer with an AA transfer partner."""
-        partners = transfer_db.partners_for_destination(CurrencyProgram.american_airlines_aadvantage)
-        source_programs = [p.source_program for p in partners]
-        assert CurrencyProgram.bilt_rewards in source_programs
-        # No other major issuer currency has AA
-        for prog in [
+    def test_bilt_transfers_to_aa(self, aa_source_programs: set[CurrencyProgram]) -> None:
+        assert CurrencyProgram.bilt_rewards in aa_source_programs
+
+    @pytest.mark.parametrize(
+        "prog",
+        [
             CurrencyProgram.chase_ur,
             CurrencyProgram.amex_mr,
             CurrencyProgram.citi_ty,
             CurrencyProgram.capital_one_miles,
-        ]:
-            assert prog not in source_programs, f"{prog} should not transfer to AA"
+        ],
+    )
+    def test_bilt_aa_advantage_unique(
+        self, aa_source_programs: set[CurrencyProgram], prog: CurrencyProgram
+    ) -> None:
+        """No other major issuer currency transfers to AA."""
+        assert prog not in aa_source_programs, f"{prog} should not transfer to AA"
 
 
 class TestTransferMath:
-    def test_chase_to_united_1_to_1(self, transfer_db: TransferPartnerDB) -> None:
-        partners = transfer_db.partners_for_destination(CurrencyProgram.united_mileageplus)
-        chase_partner = next(p for p in partners if p.source_program == CurrencyProgram.chase_ur)
-        assert chase_partner.source_points_needed(30_000) == 30_000
-
-    def test_amex_to_hilton_1_to_2(self, transfer_db: TransferPartnerDB) -> None:
-        partners = transfer_db.partners_for_destination(CurrencyProgram.hilton_honors)
-        amex_partner = next(p for p in partners if p.source_program == CurrencyProgram.amex_mr)
-        # 80k Hilton = 40k Amex
-        assert amex_partner.source_points_needed(80_000) == 40_000
+    @pytest.mark.parametrize(
+        "dest_program,source_program,dest_points,expected_source",
+        [
+            (CurrencyProgram.united_mileageplus, CurrencyProgram.chase_ur, 30_000, 30_000),
+            # 80k Hilton = 40k Amex
+            (CurrencyProgram.hilton_honors, CurrencyProgram.amex_mr, 80_000, 40_000),
+        ],
+    )
+    def test_source_points_needed(
+        self,
+        partners_by_dest_source: PartnerIndex,
+        dest_program: CurrencyProgram,
+        source_program: CurrencyProgram,
+        dest_points: int,
+        expected_source: int,
+    ) -> None:
+        partner = partners_by_dest_source[dest_program][source_program]
+        assert partner.source_points_needed(dest_points) == expected_source
 
     def test_coverage_check(self, transfer_db: TransferPartnerDB) -> None:
         balances = {
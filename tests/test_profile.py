@@ -1,5 +1,6 @@
 """Tests for user profile loading, saving, and integration."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -16,6 +17,8 @@ from travel_agent.models.profile import (
     ProfilePreferences,
     UserProfile,
     load_profile,
+    profile_from_toml,
+    profile_to_toml,
     save_profile,
 )
 from travel_agent.models.session import ConversationSession, SessionPhase
@@ -37,26 +40,41 @@ class TestProfilePoints:
         assert all(b.balance == 0 for b in balances)
 
 
-class TestUserProfile:
-    def test_has_points_true(self) -> None:
-        profile = UserProfile(points=ProfilePoints(chase=50_000))
-        assert profile.has_points is True
-
-    def test_has_points_false_when_all_zero(self) -> None:
+class TestFlagProperties:
+    @pytest.mark.parametrize(
+        "ctor,attr,expected",
+        [
+            (lambda: ConversationSession(), "profile_loaded", False),
+            (lambda: ConversationSession(profile_loaded=True), "profile_loaded", True),
+            (lambda: UserProfile(points=ProfilePoints(chase=50_000)), "has_points", True),
+            (lambda: UserProfile(), "has_points", False),
+            (lambda: UserProfile(preferences=ProfilePreferences(origin_airport="SFO")), "has_preferences", True),
+            (lambda: UserProfile(), "has_preferences", False),
+        ],
+        ids=[
+            "session-profile-loaded-default",
+            "session-profile-loaded-set",
+            "has-points",
+            "has-points-all-zero",
+            "has-preferences",
+            "has-preferences-empty",
+        ],
+    )
+    def test_flag(self, ctor: Callable[[], object], attr: str, expected: bool) -> None:
+        assert getattr(ctor(), attr) is expected
+
+    def test_flags_follow_profile_changes(self) -> None:
         profile = UserProfile()
+        profile.points.chase = 5_000
+        assert profile.has_points is True
+        profile.points = ProfilePoints()
         assert profile.has_points is False
-
-    def test_has_preferences_true(self) -> None:
-        profile = UserProfile(preferences=ProfilePreferences(origin_airport="SFO"))
-        assert profile.has_preferences is True
-
-    def test_has_preferences_false_when_empty(self) -> None:
-        profile = UserProfile()
-        assert profile.has_preferences is False
+        copied = profile.model_copy(update={"preferences": ProfilePreferences(origin_airport="SFO")})
+        assert copied.has_preferences is True
 
 
 class TestSaveLoadRoundtrip:
-    def test_roundtrip(self, tmp_path: Path) -> None:
+    def test_roundtrip(self) -> None:
         profile = UserProfile(
             preferences=ProfilePreferences(
                 origin_airport="SFO",
@@ -69,9 +87,7 @@ class TestSaveLoadRoundtrip:
                 chase=120_000, amex=85_000, citi=0, capital_one=60_000, bilt=45_000
             ),
         )
-        path = tmp_path / "profile.toml"
-        save_profile(profile, path)
-        loaded = load_profile(path)
+        loaded = profile_from_toml(profile_to_toml(profile))
 
         assert loaded is not None
         assert loaded.preferences.origin_airport == "SFO"
@@ -85,72 +101,56 @@ class TestSaveLoadRoundtrip:
         assert loaded.points.capital_one == 60_000
         assert loaded.points.bilt == 45_000
 
+    @pytest.mark.io
     def test_load_nonexistent_returns_none(self, tmp_path: Path) -> None:
         result = load_profile(tmp_path / "nope.toml")
         assert result is None
 
+    @pytest.mark.io
+    def test_load_non_utf8_returns_none(self, tmp_path: Path) -> None:
+        path = tmp_path / "profile.toml"
+        path.write_bytes(b"\xff\xfe")
+        assert load_profile(path) is None
+
+    @pytest.mark.io
     def test_save_creates_parent_dirs(self, tmp_path: Path) -> None:
         path = tmp_path / "deep" / "nested" / "profile.toml"
-        profile = UserProfile()
+        profile = UserProfile(preferences=ProfilePreferences(origin_airport="SFO"))
         save_profile(profile, path)
         assert path.exists()
+        loaded = load_profile(path)
+        assert loaded is not None
+        assert loaded.preferences.origin_airport == "SFO"
 
-    def test_malformed_toml_returns_none(self, tmp_path: Path) -> None:
-        path = tmp_path / "bad.toml"
-        path.write_text("this is not [valid toml =", encoding="utf-8")
-        assert load_profile(path) is None
+    def test_malformed_toml_returns_none(self) -> None:
+        assert profile_from_toml("this is not [valid toml =") is None
 
-    def test_invalid_enum_returns_none(self, tmp_path: Path) -> None:
-        path = tmp_path / "bad_enum.toml"
-        path.write_text(
-            '[preferences]\npoints_strategy = "ALL_POINTS"\n',
-            encoding="utf-8",
-        )
-        assert load_profile(path) is None
+    def test_invalid_enum_returns_none(self) -> None:
+        assert profile_from_toml('[preferences]\npoints_strategy = "ALL_POINTS"\n') is None
 
-    def test_save_roundtrip_with_special_chars(self, tmp_path: Path) -> None:
+    def test_save_roundtrip_with_special_chars(self) -> None:
         profile = UserProfile(
             preferences=ProfilePreferences(origin_airport='S"FO'),
         )
-        path = tmp_path / "profile.toml"
-        save_profile(profile, path)
-        loaded = load_profile(path)
+        loaded = profile_from_toml(profile_to_toml(profile))
         assert loaded is not None
         assert loaded.preferences.origin_airport == 'S"FO'
 
-    def test_toml_content_has_comments(self, tmp_path: Path) -> None:
+    def test_toml_content_has_comments(self) -> None:
         profile = UserProfile(
             preferences=ProfilePreferences(origin_airport="JFK"),
         )
-        path = tmp_path / "profile.toml"
-        save_profile(profile, path)
-        content = path.read_text()
+        content = profile_to_toml(profile)
         assert "# morning | afternoon | evening | any" in content
         assert "# budget | midrange | upscale | luxury" in content
         assert "# POINTS_ONLY | MIXED_OK" in content
 
 
-class TestProfileLoadedSession:
-    def test_session_profile_loaded_default(self) -> None:
-        session = ConversationSession()
-        assert session.profile_loaded is False
-
-    def test_session_profile_loaded_set(self) -> None:
-        session = ConversationSession(profile_loaded=True)
-        assert session.profile_loaded is True
-
-
 class TestPreferenceFallbackMerge:
-    def test_profile_defaults_fill_missing_fields(self) -> None:
+    def test_profile_defaults_fill_missing_fields(self, sample_full_prefs: TravelPreferences) -> None:
         """When the agent omits stable fields, profile defaults should be used."""
         session = ConversationSession(profile_loaded=True)
-        session.preferences = TravelPreferences(
-            origin_airport="SFO",
-            num_travelers=2,
-            flight_time_preference=FlightTimePreference.morning,
-            accommodation_tier=AccommodationTier.upscale,
-            points_strategy=PointsStrategy.mixed_ok,
-        )
+        session.preferences = sample_full_prefs
 
         # Simulate agent calling mark_preferences_complete with only trip-specific fields
         tool_input = {
@@ -190,27 +190,27 @@ class TestPreferenceFallbackMerge:
 
 
 class TestSystemPromptConditional:
-    def test_profile_loaded_prompt_mentions_defaults(self) -> None:
-        from travel_agent.agent.prompts import _phase_instructions
-
-        session = ConversationSession(profile_loaded=True)
-        session.preferences = TravelPreferences(
-            origin_airport="SFO",
-            num_travelers=2,
-            flight_time_preference=FlightTimePreference.morning,
-            accommodation_tier=AccommodationTier.upscale,
-            points_strategy=PointsStrategy.mixed_ok,
-        )
-        session.advance_phase(SessionPhase.PREFERENCE_GATHERING)
-        text = _phase_instructions(session)
-        assert "SFO" in text
-        assert "Do NOT re-ask" in text
-
-    def test_no_profile_prompt_asks_everything(self) -> None:
+    @pytest.mark.parametrize(
+        "profile_loaded,expected_substrings,forbidden_substrings",
+        [
+            (True, ["SFO", "Do NOT re-ask"], []),
+            (False, ["destination"], ["SFO", "Do NOT re-ask"]),
+        ],
+    )
+    def test_preference_gathering_prompt(
+        self,
+        sample_full_prefs: TravelPreferences,
+        profile_loaded: bool,
+        expected_substrings: list[str],
+        forbidden_substrings: list[str],
+    ) -> None:
         from travel_agent.agent.prompts import _phase_instructions
 
-        session = ConversationSession()
+        session = ConversationSession(profile_loaded=profile_loaded)
+        session.preferences = sample_full_prefs
         session.advance_phase(SessionPhase.PREFERENCE_GATHERING)
         text = _phase_instructions(session)
-        assert "destination" in text
-        assert "Do NOT re-ask" not in text
+        for s in expected_substrings:
+            assert s in text
+        for s in forbidden_substrings:
+            assert s not in text
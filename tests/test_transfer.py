@@ -1,5 +1,6 @@
 """Tests for TransferPartnerDB."""
 
+from tests.conftest import PartnerIndex, PartnersFor
 from travel_agent.clients.transfer import TransferPartnerDB
 from travel_agent.models.points import CurrencyProgram, Issuer
 
@@ -9,15 +10,15 @@ class TestTransferPartnerDB:
         assert len(transfer_db._partners) > 0
         assert len(transfer_db._valuations) > 0
 
-    def test_partners_for_destination_united(self, transfer_db: TransferPartnerDB) -> None:
-        partners = transfer_db.partners_for_destination(CurrencyProgram.united_mileageplus)
+    def test_partners_for_destination_united(self, partners_for: PartnersFor) -> None:
+        partners = partners_for(CurrencyProgram.united_mileageplus)
         source_programs = {p.source_program for p in partners}
         # Both Chase UR and Bilt transfer to United
         assert CurrencyProgram.chase_ur in source_programs
         assert CurrencyProgram.bilt_rewards in source_programs
 
-    def test_bilt_is_only_aa_partner(self, transfer_db: TransferPartnerDB) -> None:
-        partners = transfer_db.partners_for_destination(CurrencyProgram.american_airlines_aadvantage)
+    def test_bilt_is_only_aa_partner(self, partners_for: PartnersFor) -> None:
+        partners = partners_for(CurrencyProgram.american_airlines_aadvantage)
         source_programs = {p.source_program for p in partners}
         # Only Bilt transfers to AA among the major issuers
         assert CurrencyProgram.bilt_rewards in source_programs
@@ -62,11 +63,8 @@ class TestTransferPartnerDB:
         assert bilt_opt is not None
         assert bilt_opt["bilt_differentiator"] is True
 
-    def test_1_to_2_ratio_for_amex_hilton(self, transfer_db: TransferPartnerDB) -> None:
-        partners = transfer_db.partners_for_destination(CurrencyProgram.hilton_honors)
-        amex_partner = next(
-            (p for p in partners if p.source_program == CurrencyProgram.amex_mr), None
-        )
+    def test_1_to_2_ratio_for_amex_hilton(self, partners_by_dest_source: PartnerIndex) -> None:
+        amex_partner = partners_by_dest_source[CurrencyProgram.hilton_honors].get(CurrencyProgram.amex_mr)
         assert amex_partner is not None
         assert amex_partner.ratio_from == 1
         assert amex_partner.ratio_to == 2